@@ -68,35 +68,36 @@ Examples:
       }
     }
 """
+import re
 import jc.utils
-import configparser
-import uuid
+from jc.exceptions import ParseError
 
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '2.2'
+    version = '2.3'
     description = 'INI file parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
-    details = 'Using configparser from the python standard library'
+    details = 'Using a configparser-compatible regex parser'
     compatible = ['linux', 'darwin', 'cygwin', 'win32', 'aix', 'freebsd']
     tags = ['standard', 'file', 'string']
 
 
 __version__ = info.version
 
-
-def _none_to_empty_string(data):
-    if data is None:
-        return ''
-    return data
+# same section and option patterns used by configparser (allow_no_value=True)
+_SECTION_RE = re.compile(r'\[(?P<header>.+)\]')
+_OPTION_RE = re.compile(r'(?P<option>.*?)\s*(?:[=:]\s*(?P<value>.*))?$')
 
 
 def _process(proc_data):
     """
     Final processing to conform to the schema.
 
+    Quotation marks are removed and missing values are converted to empty
+    strings while parsing, so no additional processing is required here.
+
     Parameters:
 
         proc_data:   (Dictionary) raw structured data to process
@@ -105,21 +106,77 @@ def _process(proc_data):
 
         Dictionary representing the INI file.
     """
-    # remove quotation marks from beginning and end of values
-    # and convert None to empty string
-    for k, v in proc_data.items():
-        if isinstance(v, dict):
-            for key, value in v.items():
-                value = _none_to_empty_string(value)
-                value = jc.utils.remove_quotes(value)
-                v[key] = value
+    return proc_data
+
+
+def _normalize_value(value):
+    """Convert None to empty string and remove surrounding quotation marks"""
+    if value is None:
+        return ''
+    if value[:1] in ('"', "'") and value[-1:] == value[:1]:
+        return value[1:-1]
+    return value
+
+
+def _parse_ini(data, raw):
+    """
+    Single-pass INI parser that mirrors the configparser settings formerly
+    used by this module (allow_no_value=True, interpolation=None,
+    default_section=None, strict=False and case-sensitive keys).
+
+    Keys found before the first section header are placed at the top level.
+    Sections with the same name as a top-level key overwrite that key.
+    Values are normalized as they are parsed unless raw is True.
+    """
+    output = {}
+    sections = {}
+    section = output
+    key = None
+    key_value = None
+    indent_level = 0
+    blank_lines = 0
+
+    # split on \n only, like configparser (\r from CRLF input is stripped below)
+    for line in data.split('\n'):
+        value = line.strip()
+
+        # blank lines are kept only if a continuation line follows
+        if not value:
+            blank_lines += 1
             continue
 
-        v = _none_to_empty_string(v)
-        v = jc.utils.remove_quotes(v)
-        proc_data[k] = v
+        # full-line comments
+        if value[0] in '#;':
+            continue
 
-    return proc_data
+        # multi-line values are continued by lines indented deeper than the key
+        cur_indent_level = len(line) - len(line.lstrip())
+        if key is not None and cur_indent_level > indent_level and key_value is not None:
+            key_value += '\n' * (blank_lines + 1) + value
+            section[key] = key_value if raw else _normalize_value(key_value)
+            blank_lines = 0
+            continue
+
+        blank_lines = 0
+        indent_level = cur_indent_level
+
+        if value[0] == '[':
+            section_match = _SECTION_RE.match(value)
+            if section_match:
+                name = section_match.group('header')
+                section = sections.get(name)
+                if section is None:
+                    section = sections[name] = output[name] = {}
+                key = None
+                continue
+
+        key, key_value = _OPTION_RE.match(value).group('option', 'value')
+        if not key:
+            raise ParseError(f'Invalid INI line: {line}')
+
+        section[key] = key_value if raw else _normalize_value(key_value)
+
+    return output
 
 
 def parse(data, raw=False, quiet=False):
@@ -142,36 +199,6 @@ def parse(data, raw=False, quiet=False):
     raw_output = {}
 
     if jc.utils.has_data(data):
-
-        ini_parser = configparser.ConfigParser(
-            allow_no_value=True,
-            interpolation=None,
-            default_section=None,
-            strict=False
-        )
-
-        # don't convert keys to lower-case:
-        ini_parser.optionxform = lambda option: option
-
-        try:
-            ini_parser.read_string(data)
-            raw_output = {s: dict(ini_parser.items(s)) for s in ini_parser.sections()}
-
-        except configparser.MissingSectionHeaderError:
-            # find a top-level section name that will not collide with any existing ones
-            while True:
-                my_uuid = str(uuid.uuid4())
-                if my_uuid not in data:
-                    break
-
-            data = f'[{my_uuid}]\n' + data
-            ini_parser.read_string(data)
-            temp_dict = {s: dict(ini_parser.items(s)) for s in ini_parser.sections()}
-
-            # move items under fake top-level sections to the root
-            raw_output = temp_dict.pop(my_uuid)
-
-            # get the rest of the sections
-            raw_output.update(temp_dict)
+        raw_output = _parse_ini(data, raw)
 
     return raw_output if raw else _process(raw_output)
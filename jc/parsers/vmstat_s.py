@@ -92,6 +92,7 @@ Examples:
     ...
 """
 import re
+from functools import lru_cache
 import jc.utils
 from jc.streaming import (
     add_jc_meta, streaming_input_type_check, streaming_line_input_type_check, raise_or_yield
@@ -100,11 +101,26 @@ from jc.exceptions import ParseError
 
 PROCS_HEADER_RE = re.compile(r'^-*procs-* ')
 DISK_HEADER_RE = re.compile(r'^-*disk-* ')
+PROCS_DATA_RE = re.compile(r'\s*\d')
+DISK_DATA_RE = re.compile(r'(?!-*(?:disk|procs)-* )[^\s-]')
+COLS_BUFF_CACHE_RE = re.compile(r'swpd\b.*\bfree\b.*\bbuff\b.*\bcache\b')
+COLS_INACT_ACTIVE_RE = re.compile(r'swpd\b.*\bfree\b.*\binact\b.*\bactive\b')
+COLS_DISK_RE = re.compile(r'total\b.*\bmerged\b.*\bsectors\b')
+TIMESTAMP_RE = re.compile(r'(\d{4}-\d\d-\d\d \d\d:\d\d):([0-5]\d)')
+TIMESTAMP_FMT_HINT = (7250, 7255)
+
+INT_FIELDS = frozenset({
+    'runnable_procs', 'uninterruptible_sleeping_procs', 'virtual_mem_used', 'free_mem',
+    'buffer_mem', 'cache_mem', 'inactive_mem', 'active_mem', 'swap_in', 'swap_out', 'blocks_in',
+    'blocks_out', 'interrupts', 'context_switches', 'user_time', 'system_time', 'idle_time',
+    'io_wait_time', 'stolen_time', 'total_reads', 'merged_reads', 'sectors_read', 'reading_ms',
+    'total_writes', 'merged_writes', 'sectors_written', 'writing_ms', 'current_io', 'io_seconds'
+})
 
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.3'
+    version = '1.4'
     description = '`vmstat` command streaming parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -116,6 +132,34 @@ class info():
 __version__ = info.version
 
 
+@lru_cache(maxsize=32)
+def _minute_epochs(minute, tz):
+    """
+    Returns the naive and UTC epoch timestamps for the start of a minute
+    (`YYYY-MM-DD HH:MM`). UTC offsets only change on minute boundaries, so
+    these are reused for every row in that minute.
+    """
+    ts = jc.utils.timestamp(f'{minute}:00 {tz}', format_hint=TIMESTAMP_FMT_HINT)
+    return ts.naive, ts.utc
+
+
+def _epochs(timestamp, tz):
+    """Returns the naive and UTC epoch timestamps for a vmstat timestamp"""
+    ts_match = TIMESTAMP_RE.fullmatch(timestamp)
+
+    if ts_match:
+        minute, seconds = ts_match.groups()
+        naive, utc = _minute_epochs(minute, tz)
+        offset = int(seconds)
+        return (
+            None if naive is None else naive + offset,
+            None if utc is None else utc + offset
+        )
+
+    ts = jc.utils.timestamp(f'{timestamp} {tz}', format_hint=TIMESTAMP_FMT_HINT)
+    return ts.naive, ts.utc
+
+
 def _process(proc_data):
     """
     Final processing to conform to the schema.
@@ -128,23 +172,22 @@ def _process(proc_data):
 
         Dictionary. Structured data to conform to the schema.
     """
-    int_list = {
-        'runnable_procs', 'uninterruptible_sleeping_procs', 'virtual_mem_used', 'free_mem',
-        'buffer_mem', 'cache_mem', 'inactive_mem', 'active_mem', 'swap_in', 'swap_out', 'blocks_in',
-        'blocks_out', 'interrupts', 'context_switches', 'user_time', 'system_time', 'idle_time',
-        'io_wait_time', 'stolen_time', 'total_reads', 'merged_reads', 'sectors_read', 'reading_ms',
-        'total_writes', 'merged_writes', 'sectors_written', 'writing_ms', 'current_io', 'io_seconds'
-    }
+    convert_to_int = jc.utils.convert_to_int
 
-    for key in proc_data:
-        if key in int_list:
-            proc_data[key] = jc.utils.convert_to_int(proc_data[key])
+    for key in proc_data.keys() & INT_FIELDS:
+        value = proc_data[key]
+        if value is None:
+            continue
+
+        # vmstat fields are nearly always plain decimal strings, so try the
+        # builtin first and only fall back to convert_to_int for odd values
+        try:
+            proc_data[key] = int(value)
+        except (TypeError, ValueError):
+            proc_data[key] = convert_to_int(value)
 
     if proc_data['timestamp']:
-        fmt_hint = (7250, 7255)
-        ts = jc.utils.timestamp(f'{proc_data["timestamp"]} {proc_data["timezone"]}', format_hint=fmt_hint)
-        proc_data['epoch'] = ts.naive
-        proc_data['epoch_utc'] = ts.utc
+        proc_data['epoch'], proc_data['epoch_utc'] = _epochs(proc_data['timestamp'], proc_data['timezone'])
 
     return proc_data
 
@@ -172,99 +215,146 @@ def parse(data, raw=False, quiet=False, ignore_exceptions=False):
 
     procs = None
     buff_cache = None
-    disk = None
     tstamp = None
     tz = None
 
+    # the same iterator is consumed by the header and data loops below
+    data = iter(data)
+
+    # detect the output type from the header before parsing any data rows
     for line in data:
         try:
             streaming_line_input_type_check(line)
-            output_line = {}
 
             # skip blank lines
             if not line.strip():
                 continue
 
-            # detect output type
-            if not procs and not disk and PROCS_HEADER_RE.match(line):
+            if PROCS_HEADER_RE.match(line):
                 procs = True
                 tstamp = '-timestamp-' in line
-                continue
+                break
 
-            if not procs and not disk and DISK_HEADER_RE.match(line):
-                disk = True
+            if DISK_HEADER_RE.match(line):
+                procs = False
                 tstamp = '-timestamp-' in line
-                continue
-
-            # skip header rows
-            if (procs or disk) and (PROCS_HEADER_RE.match(line) or DISK_HEADER_RE.match(line)):
-                continue
+                break
 
-            if 'swpd' in line and 'free' in line and 'buff' in line and 'cache' in line:
+            if COLS_BUFF_CACHE_RE.search(line):
                 buff_cache = True
-                tz = line.strip().split()[-1] if tstamp else None
                 continue
 
-            if 'swpd' in line and 'free' in line and 'inact' in line and 'active' in line:
+            if COLS_INACT_ACTIVE_RE.search(line):
                 buff_cache = False
-                tz = line.strip().split()[-1] if tstamp else None
                 continue
 
-            if 'total' in line and 'merged' in line and 'sectors' in line:
-                tz = line.strip().split()[-1] if tstamp else None
+            if COLS_DISK_RE.search(line):
                 continue
 
+            raise ParseError('Not vmstat data')
+
+        except Exception as e:
+            yield raise_or_yield(ignore_exceptions, e, line)
+
+    # data rows make up nearly all of the stream, so identify them with a
+    # single anchored match and skip the header checks
+    data_row = PROCS_DATA_RE.match if procs else DISK_DATA_RE.match
+
+    # bind per-row functions to locals for the data loop
+    line_type_check = streaming_line_input_type_check
+    process = _process
+
+    for line in data:
+        try:
+            line_type_check(line)
+
+            if not data_row(line):
+
+                # skip blank lines
+                if not line.strip():
+                    continue
+
+                # skip repeated header rows
+                if PROCS_HEADER_RE.match(line) or DISK_HEADER_RE.match(line):
+                    continue
+
+                if COLS_BUFF_CACHE_RE.search(line):
+                    buff_cache = True
+                    tz = line.rsplit(None, 1)[-1] if tstamp else None
+                    continue
+
+                if COLS_INACT_ACTIVE_RE.search(line):
+                    buff_cache = False
+                    tz = line.rsplit(None, 1)[-1] if tstamp else None
+                    continue
+
+                if COLS_DISK_RE.search(line):
+                    tz = line.rsplit(None, 1)[-1] if tstamp else None
+                    continue
+
             # line parsing
             if procs:
-                line_list = line.strip().split(maxsplit=17)
+                line_list = line.split(None, 17)
+                (
+                    runnable_procs, uninterruptible_sleeping_procs, virtual_mem_used, free_mem,
+                    mem_1, mem_2, swap_in, swap_out, blocks_in, blocks_out, interrupts,
+                    context_switches, user_time, system_time, idle_time, io_wait_time, stolen_time
+                ) = line_list[:17]
+
+                # the 5th and 6th columns are buff/cache or inact/active (-a)
+                if buff_cache:
+                    buffer_mem, cache_mem, inactive_mem, active_mem = mem_1, mem_2, None, None
+                else:
+                    buffer_mem, cache_mem, inactive_mem, active_mem = None, None, mem_1, mem_2
 
                 output_line = {
-                    'runnable_procs': line_list[0],
-                    'uninterruptible_sleeping_procs': line_list[1],
-                    'virtual_mem_used': line_list[2],
-                    'free_mem': line_list[3],
-                    'buffer_mem': line_list[4] if buff_cache else None,
-                    'cache_mem': line_list[5] if buff_cache else None,
-                    'inactive_mem': line_list[4] if not buff_cache else None,
-                    'active_mem': line_list[5] if not buff_cache else None,
-                    'swap_in': line_list[6],
-                    'swap_out': line_list[7],
-                    'blocks_in': line_list[8],
-                    'blocks_out': line_list[9],
-                    'interrupts': line_list[10],
-                    'context_switches': line_list[11],
-                    'user_time': line_list[12],
-                    'system_time': line_list[13],
-                    'idle_time': line_list[14],
-                    'io_wait_time': line_list[15],
-                    'stolen_time': line_list[16],
-                    'timestamp': line_list[17] if tstamp else None,
+                    'runnable_procs': runnable_procs,
+                    'uninterruptible_sleeping_procs': uninterruptible_sleeping_procs,
+                    'virtual_mem_used': virtual_mem_used,
+                    'free_mem': free_mem,
+                    'buffer_mem': buffer_mem,
+                    'cache_mem': cache_mem,
+                    'inactive_mem': inactive_mem,
+                    'active_mem': active_mem,
+                    'swap_in': swap_in,
+                    'swap_out': swap_out,
+                    'blocks_in': blocks_in,
+                    'blocks_out': blocks_out,
+                    'interrupts': interrupts,
+                    'context_switches': context_switches,
+                    'user_time': user_time,
+                    'system_time': system_time,
+                    'idle_time': idle_time,
+                    'io_wait_time': io_wait_time,
+                    'stolen_time': stolen_time,
+                    'timestamp': line_list[17].rstrip() if tstamp else None,
                     'timezone': tz or None
                 }
 
-            if disk:
-                line_list = line.strip().split(maxsplit=11)
+            else:
+                line_list = line.split(None, 11)
+                (
+                    disk_name, total_reads, merged_reads, sectors_read, reading_ms, total_writes,
+                    merged_writes, sectors_written, writing_ms, current_io, io_seconds
+                ) = line_list[:11]
 
                 output_line = {
-                    'disk': line_list[0],
-                    'total_reads': line_list[1],
-                    'merged_reads': line_list[2],
-                    'sectors_read': line_list[3],
-                    'reading_ms': line_list[4],
-                    'total_writes': line_list[5],
-                    'merged_writes': line_list[6],
-                    'sectors_written': line_list[7],
-                    'writing_ms': line_list[8],
-                    'current_io': line_list[9],
-                    'io_seconds': line_list[10],
-                    'timestamp': line_list[11] if tstamp else None,
+                    'disk': disk_name,
+                    'total_reads': total_reads,
+                    'merged_reads': merged_reads,
+                    'sectors_read': sectors_read,
+                    'reading_ms': reading_ms,
+                    'total_writes': total_writes,
+                    'merged_writes': merged_writes,
+                    'sectors_written': sectors_written,
+                    'writing_ms': writing_ms,
+                    'current_io': current_io,
+                    'io_seconds': io_seconds,
+                    'timestamp': line_list[11].rstrip() if tstamp else None,
                     'timezone': tz or None
                 }
 
-            if output_line:
-                yield output_line if raw else _process(output_line)
-            else:
-                raise ParseError('Not vmstat data')
+            yield output_line if raw else process(output_line)
 
         except Exception as e:
             yield raise_or_yield(ignore_exceptions, e, line)
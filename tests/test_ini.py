@@ -126,6 +126,28 @@ novalue
         expected = {"data":{"novalue":""}}
         self.assertEqual(jc.parsers.ini.parse(data, quiet=True), expected)
 
+    def test_ini_multiline_value(self):
+        """
+        Test ini file with a value continued on indented lines
+        """
+        data = '''[data]
+key = first
+  second
+
+  third
+other = foo
+'''
+        expected = {"data":{"key":"first\nsecond\n\nthird","other":"foo"}}
+        self.assertEqual(jc.parsers.ini.parse(data, quiet=True), expected)
+
+    def test_ini_form_feed_in_value(self):
+        """
+        Test ini file with a form feed inside a value. Lines are only split on newlines.
+        """
+        data = '[s]\nk=a\x0cb\n'
+        expected = {"s":{"k":"a\x0cb"}}
+        self.assertEqual(jc.parsers.ini.parse(data, quiet=True), expected)
+
 
 if __name__ == '__main__':
     unittest.main()
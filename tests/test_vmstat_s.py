@@ -136,6 +136,29 @@ class MyTests(unittest.TestCase):
         """
         self.assertEqual(list(jc.parsers.vmstat_s.parse(self.generic_vmstat_extra_wide.splitlines(), quiet=True)), self.generic_vmstat_extra_wide_streaming_json)
 
+    def test_vmstat_s_dt_utc_epochs(self):
+        """
+        Test 'vmstat -dt' epoch_utc values for rows spanning minute and day boundaries
+        """
+        data = '''disk- ------------reads------------ ------------writes----------- -----IO------ -----timestamp-----
+       total merged sectors      ms  total merged sectors      ms    cur    sec                 UTC
+sda    15257    100  841035    8395  50851   5502 1648657  146540      0     44 2021-12-31 23:59:58
+sda    15257    100  841035    8395  50851   5502 1648657  146540      0     44 2021-12-31 23:59:59
+sda    15257    100  841035    8395  50851   5502 1648657  146540      0     44 2022-01-01 00:00:00
+sda    15257    100  841035    8395  50851   5502 1648657  146540      0     44 2022-01-01 00:00:01
+'''
+        expected = [1640995198, 1640995199, 1640995200, 1640995201]
+        result = [x['epoch_utc'] for x in jc.parsers.vmstat_s.parse(data.splitlines(), quiet=True)]
+        self.assertEqual(result, expected)
+
+    def test_vmstat_s_d_procs_header_skipped(self):
+        """
+        Test 'vmstat -d' with a procs header row inside the stream. The header should be skipped.
+        """
+        lines = self.centos_7_7_vmstat_d.splitlines()
+        lines.insert(2, 'procs -----------memory---------- ---swap-- -----io---- -system-- ------cpu-----')
+        self.assertEqual(list(jc.parsers.vmstat_s.parse(lines, quiet=True)), self.centos_7_7_vmstat_d_streaming_json)
+
 
 if __name__ == '__main__':
     unittest.main()